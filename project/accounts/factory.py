@@ -1,29 +1,38 @@
 import factory
 import factory.fuzzy
-from django.contrib.auth.models import User
+from django.contrib.auth import get_user_model
 
-from .modes import Profile
+from .models import Profile
 
 
 class UserFactory(factory.django.DjangoModelFactory):
     class Meta:
-        model = User
+        model = get_user_model()
 
-    username = factory.Faker("sentence", nb_words=20)
+    username = factory.Sequence(lambda n: f"user{n}")
 
 
 class ProfileFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Profile
 
-    user = factory.SubFactory("app.factories.UserFactory")
-    first_name = factory.Faker("lorem")
-    last_name = factory.Faker("lorem")
-    about_me = factory.Faker("lorem")
+    user = factory.SubFactory(UserFactory)
+    first_name = factory.Faker("first_name")
+    last_name = factory.Faker("last_name")
+    about_me = factory.Faker("sentence")
     is_verified = factory.fuzzy.FuzzyChoice(choices=[True, False])
     profile_image = factory.Faker("image_url")
     profile_image_thumb = factory.Faker("image_url")
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        # Users get a profile from the post_save signal,
+        # so fill that one in with the declared fields
+        profile, _created = model_class.objects.update_or_create(
+            user=kwargs.pop("user"), defaults=kwargs
+        )
+        return profile
+
     @factory.post_generation
     def categories(self, create, extracted, **kwargs):
         if not create:
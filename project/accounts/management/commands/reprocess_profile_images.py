@@ -0,0 +1,83 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from accounts.models import Profile
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def _reprocess_one(pk):
+    """
+    Resize the stored images of a profile with the current PROFILE_IMG settings.
+    Returns an error message if the stored image can't be read, otherwise None.
+    """
+
+    profile = Profile.objects.get(pk=pk)
+    old_names = {profile.profile_image.name, profile.profile_image_thumb.name}
+
+    try:
+        with profile.profile_image.open("rb") as stored_image:
+            # Assigning the stored file again makes save() treat it as a new upload
+            profile.profile_image = File(
+                stored_image, name=os.path.basename(stored_image.name)
+            )
+            # Only write the image columns, so edits made to the profile
+            # while the command runs are kept
+            profile.save(update_fields=["profile_image", "profile_image_thumb"])
+    except (OSError, ValueError) as error:
+        return str(error)
+
+    for name in old_names - {None, ""}:
+        default_storage.delete(name)
+
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Resize all uploaded profile images and thumbnails "
+        "after changing the PROFILE_IMG settings"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=max(1, (os.cpu_count() or 1) - 1),
+            help="Number of worker processes (default: one less than the CPU count)",
+        )
+
+    def handle(self, *args, jobs, **options):
+        if jobs < 1:
+            raise CommandError("--jobs must be at least 1.")
+
+        pks = list(
+            Profile.objects.exclude(profile_image="")
+            .exclude(profile_image__isnull=True)
+            .values_list("pk", flat=True)
+        )
+
+        if jobs == 1:
+            errors = [_reprocess_one(pk) for pk in pks]
+        else:
+            # Worker processes must open their own database connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=django.setup
+            ) as executor:
+                errors = list(executor.map(_reprocess_one, pks))
+
+        failed = 0
+        for pk, error in zip(pks, errors):
+            if error is not None:
+                failed += 1
+                self.stderr.write(f"Could not reprocess profile {pk}: {error}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Reprocessed {len(pks) - failed} profile images")
+        )
+        if failed:
+            self.stderr.write(f"Failed to reprocess {failed} profile images")
@@ -1,16 +1,35 @@
 import io
-import os
 
 from categories.models import Category
-from common.utils import PathAndRename
+from common.utils import PathAndRename, imgproxy_url
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.db import models
+from django.utils.functional import cached_property
 from PIL import Image, ImageOps
 from taggit.managers import TaggableManager
 
+# Profile image dimensions and background, read once at import time
+_PROFILE_SIZE = tuple(settings.PROFILE_IMG["SIZE"])
+_THUMB_SIZE = tuple(settings.PROFILE_IMG["THUMB_SIZE"])
+_WHITE_BG = tuple(settings.PROFILE_IMG["WHITE_BG"])
+
+
+def _image_exists_cached(name):
+    """
+    Check if a file exists in the default storage, caching the answer.
+    Uploads get unique names, so a cached answer stays valid for a file name.
+    """
+
+    return cache.get_or_set(
+        f"imgexists:{name}",
+        lambda: default_storage.exists(name),
+        7 * 24 * 60 * 60,
+    )
+
 
 class User(AbstractUser):
     """
@@ -22,7 +41,7 @@ class User(AbstractUser):
     class Meta:
         db_table = "users"
 
-    @property
+    @cached_property
     def upvoted_solutions(self):
         """
         Return solutions that this user has given a positive vote.
@@ -31,7 +50,9 @@ class User(AbstractUser):
         from threads.models import Activity
 
         return Activity.objects.filter(
-            user=self.id, civi__c_type="solution", activity_type__contains="pos"
+            user=self.id,
+            civi__c_type="solution",
+            activity_type__in=("vote_pos", "vote_vpos"),
         )
 
     def __str__(self) -> str:
@@ -71,29 +92,28 @@ class Profile(models.Model):
 
         return f"{self.first_name} {self.last_name}"
 
-    @property
+    @cached_property
     def profile_image_url(self):
         """Return placeholder profile image if user didn't upload one"""
 
-        if self.profile_image:
-            file_exists = default_storage.exists(
-                os.path.join(settings.MEDIA_ROOT, self.profile_image.name)
-            )
-            if file_exists:
-                return self.profile_image.url
+        if self.profile_image and _image_exists_cached(self.profile_image.name):
+            return self.profile_image.url
 
         return "/static/img/no_image_md.png"
 
-    @property
+    @cached_property
     def profile_image_thumb_url(self):
         """Return placeholder profile image if user didn't upload one"""
 
+        if settings.IMGPROXY_URL:
+            if self.profile_image and _image_exists_cached(self.profile_image.name):
+                return imgproxy_url(self.profile_image.url, _THUMB_SIZE)
+            return "/static/img/no_image_md.png"
+
+        # The thumbnail is written together with the profile image,
+        # so there is no need to ask the storage about it
         if self.profile_image_thumb:
-            file_exists = default_storage.exists(
-                os.path.join(settings.MEDIA_ROOT, self.profile_image_thumb.name)
-            )
-            if file_exists:
-                return self.profile_image_thumb.url
+            return self.profile_image_thumb.url
 
         return "/static/img/no_image_md.png"
 
@@ -101,9 +121,15 @@ class Profile(models.Model):
         """Image crop/resize and thumbnail creation"""
 
         # New Profile image --
-        if self.profile_image:
+        # Uploaded files stay uncommitted until the model is saved, so
+        # saves that don't touch the image skip the resize
+        if self.profile_image and not self.profile_image._committed:
             self.resize_profile_image()
 
+        # Forget URLs cached for the previous image
+        self.__dict__.pop("profile_image_url", None)
+        self.__dict__.pop("profile_image_thumb_url", None)
+
         super(Profile, self).save(*args, **kwargs)
 
     def resize_profile_image(self):
@@ -116,46 +142,82 @@ class Profile(models.Model):
         # - less disk space?
         # - desired shape?
 
-        profile_image = Image.open(self.profile_image)
-        # Resize image
-        profile_image = ImageOps.fit(
-            profile_image,
-            settings.PROFILE_IMG["SIZE"],
-            Image.ANTIALIAS,
-            centering=(0.5, 0.5),
-        )
+        with Image.open(self.profile_image) as uploaded_image:
+            # Let the JPEG decoder scale down by 1/2, 1/4 or 1/8 while decoding,
+            # as long as the result still covers the profile size.
+            # This is a no-op for other formats.
+            uploaded_image.draft("RGB", _PROFILE_SIZE)
+            # Decode right away so the uploaded file can be released
+            # before the resized copies are encoded
+            uploaded_image.load()
+            self.profile_image.close()
+
+            # Shrink large uploads by an integer factor first (cheap box filter),
+            # keeping at least twice the target size for the Lanczos pass below,
+            # the same reducing gap Image.thumbnail uses by default
+            reduce_factor = (
+                min(
+                    uploaded_image.width // _PROFILE_SIZE[0],
+                    uploaded_image.height // _PROFILE_SIZE[1],
+                )
+                // 2
+            )
+            source_image = uploaded_image
+            if reduce_factor > 1 and uploaded_image.mode not in ("1", "P"):
+                source_image = uploaded_image.reduce(reduce_factor)
+
+            # Resize image
+            profile_image = ImageOps.fit(
+                source_image,
+                _PROFILE_SIZE,
+                Image.ANTIALIAS,
+                centering=(0.5, 0.5),
+            )
+            source_image.close()
 
         # Convert to JPG image format with white background
         if profile_image.mode not in ("L", "RGB"):
             white_bg_img = Image.new(
                 "RGB",
-                settings.PROFILE_IMG["SIZE"],
-                settings.PROFILE_IMG["WHITE_BG"],
+                _PROFILE_SIZE,
+                _WHITE_BG,
             )
-            white_bg_img.paste(profile_image, mask=profile_image.split()[3])
+            # An RGBA image used as a mask contributes its alpha band
+            with profile_image.convert("RGBA") as rgba_image:
+                white_bg_img.paste(rgba_image, mask=rgba_image)
+            profile_image.close()
             profile_image = white_bg_img
 
         # Save new cropped image
         tmp_image_file = io.BytesIO()
-        profile_image.save(tmp_image_file, "JPEG", quality=90)
+        profile_image.save(
+            tmp_image_file,
+            "JPEG",
+            quality=85,
+            optimize=True,
+            progressive=True,
+            subsampling=2,
+        )
         tmp_image_file.seek(0)
         self.profile_image = InMemoryUploadedFile(
             tmp_image_file,
             "ImageField",
             self.profile_image.name,
             "image/jpeg",
-            profile_image.tell(),
+            tmp_image_file.getbuffer().nbytes,
             None,
         )
         # Make a Thumbnail Image for the new resized image
-        thumb_image = profile_image.copy()
-
-        thumb_image.thumbnail(
-            settings.PROFILE_IMG["THUMB_SIZE"],
-            resample=Image.ANTIALIAS,
-        )
+        thumb_image = ImageOps.fit(profile_image, _THUMB_SIZE, Image.ANTIALIAS)
         tmp_thumb_file = io.BytesIO()
-        thumb_image.save(tmp_thumb_file, "JPEG", quality=90)
+        thumb_image.save(
+            tmp_thumb_file,
+            "JPEG",
+            quality=80,
+            optimize=True,
+            progressive=True,
+            subsampling=2,
+        )
         tmp_thumb_file.seek(0)
 
         self.profile_image_thumb = InMemoryUploadedFile(
@@ -163,6 +225,10 @@ class Profile(models.Model):
             "ImageField",
             self.profile_image.name,
             "image/jpeg",
-            thumb_image.tell(),
+            tmp_thumb_file.getbuffer().nbytes,
             None,
         )
+
+        # Free the decoded pixels now instead of whenever the images are collected
+        thumb_image.close()
+        profile_image.close()
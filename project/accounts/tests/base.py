@@ -0,0 +1,16 @@
+import shutil
+import tempfile
+
+from django.test import override_settings
+
+
+class TempMediaRootMixin:
+    """Store files uploaded during a test in a temporary MEDIA_ROOT"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
@@ -0,0 +1,100 @@
+import io
+from unittest import mock
+
+from accounts.models import Profile
+from accounts.tests.base import TempMediaRootMixin
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from PIL import Image
+
+
+class ReprocessProfileImagesTests(TempMediaRootMixin, TestCase):
+    """A class to test the reprocess_profile_images command"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.test_profile = self.create_profile("testuser")
+
+    def create_profile(self, username):
+        user = get_user_model().objects.create_user(
+            username=username, email=f"{username}@test.com", password="password123"
+        )
+        image_file = io.BytesIO()
+        Image.new("RGB", (800, 600)).save(image_file, "JPEG")
+        profile = user.profile
+        profile.profile_image = SimpleUploadedFile("upload.jpg", image_file.getvalue())
+        profile.save()
+        return profile
+
+    def test_profile_images_are_replaced(self):
+        """Whether the command stores new images and removes the old ones"""
+
+        old_names = [
+            self.test_profile.profile_image.name,
+            self.test_profile.profile_image_thumb.name,
+        ]
+
+        call_command("reprocess_profile_images", jobs=1, stdout=io.StringIO())
+
+        profile = Profile.objects.get(pk=self.test_profile.pk)
+        self.assertNotIn(profile.profile_image.name, old_names)
+        for name in old_names:
+            self.assertFalse(default_storage.exists(name))
+        with Image.open(profile.profile_image) as profile_image:
+            self.assertEqual(profile_image.size, settings.PROFILE_IMG["SIZE"])
+        with Image.open(profile.profile_image_thumb) as thumb_image:
+            self.assertEqual(thumb_image.size, settings.PROFILE_IMG["THUMB_SIZE"])
+
+    def test_other_profile_fields_are_kept(self):
+        """Whether edits made while an image is reprocessed are not overwritten"""
+
+        resize_profile_image = Profile.resize_profile_image
+
+        def edit_during_resize(profile):
+            Profile.objects.filter(pk=profile.pk).update(about_me="Edited")
+            resize_profile_image(profile)
+
+        with mock.patch.object(
+            Profile,
+            "resize_profile_image",
+            autospec=True,
+            side_effect=edit_during_resize,
+        ):
+            call_command("reprocess_profile_images", jobs=1, stdout=io.StringIO())
+
+        self.assertEqual(
+            Profile.objects.get(pk=self.test_profile.pk).about_me, "Edited"
+        )
+
+    def test_missing_image_does_not_stop_other_profiles(self):
+        """Whether profiles with a missing file are reported and the rest processed"""
+
+        broken_profile = self.create_profile("brokenuser")
+        default_storage.delete(broken_profile.profile_image.name)
+        old_name = self.test_profile.profile_image.name
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        call_command("reprocess_profile_images", jobs=1, stdout=stdout, stderr=stderr)
+
+        self.assertNotEqual(
+            Profile.objects.get(pk=self.test_profile.pk).profile_image.name, old_name
+        )
+        self.assertEqual(
+            Profile.objects.get(pk=broken_profile.pk).profile_image.name,
+            broken_profile.profile_image.name,
+        )
+        self.assertIn("Reprocessed 1 profile images", stdout.getvalue())
+        self.assertIn(
+            f"Could not reprocess profile {broken_profile.pk}", stderr.getvalue()
+        )
+        self.assertIn("Failed to reprocess 1 profile images", stderr.getvalue())
+
+    def test_jobs_must_be_positive(self):
+        """Whether a job count below one is rejected"""
+
+        with self.assertRaises(CommandError):
+            call_command("reprocess_profile_images", jobs=0, stdout=io.StringIO())
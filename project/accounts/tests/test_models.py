@@ -1,6 +1,17 @@
+import io
+from unittest import mock
+from urllib.parse import quote
+
+from accounts.factory import ProfileFactory
 from accounts.models import Profile
+from accounts.tests.base import TempMediaRootMixin
+from common.utils import imgproxy_url
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from threads.models import Activity, Civi, Thread
 
 
 class BaseTestCase(TestCase):
@@ -38,6 +49,154 @@ class ProfileModelTests(BaseTestCase):
             self.test_profile.profile_image_url, "/static/img/no_image_md.png"
         )
 
+    def test_profile_factory_keeps_declared_fields(self):
+        """Whether ProfileFactory saves the fields it is given"""
+
+        profile = ProfileFactory(first_name="Bob")
+        profile.refresh_from_db()
+
+        self.assertEqual(profile.first_name, "Bob")
+        self.assertEqual(Profile.objects.filter(user=profile.user).count(), 1)
+
+
+class ProfileImageTests(TempMediaRootMixin, BaseTestCase):
+    """A class to test Profile image processing"""
+
+    def attach_image(self, mode="RGB", size=(800, 600), image_format="JPEG"):
+        image_file = io.BytesIO()
+        Image.new(mode, size).save(image_file, image_format)
+        self.test_profile.profile_image = SimpleUploadedFile(
+            f"upload.{image_format.lower()}", image_file.getvalue()
+        )
+
+    def test_profile_image_is_resized(self):
+        """Whether an uploaded image is cropped to the profile and thumbnail sizes"""
+
+        self.attach_image()
+        self.test_profile.save()
+
+        with Image.open(self.test_profile.profile_image) as profile_image:
+            self.assertEqual(profile_image.format, "JPEG")
+            self.assertEqual(profile_image.size, settings.PROFILE_IMG["SIZE"])
+        with Image.open(self.test_profile.profile_image_thumb) as thumb_image:
+            self.assertEqual(thumb_image.format, "JPEG")
+            self.assertEqual(thumb_image.size, settings.PROFILE_IMG["THUMB_SIZE"])
+
+    def test_large_profile_image_is_resized(self):
+        """Whether a large upload is cropped to the profile size"""
+
+        self.attach_image(size=(1280, 960))
+        self.test_profile.resize_profile_image()
+
+        with Image.open(self.test_profile.profile_image) as profile_image:
+            self.assertEqual(profile_image.size, settings.PROFILE_IMG["SIZE"])
+
+        for mode in ("RGB", "RGBA", "LA", "P"):
+            with self.subTest(mode=mode):
+                self.attach_image(mode=mode, size=(1280, 960), image_format="PNG")
+                self.test_profile.resize_profile_image()
+
+                with Image.open(self.test_profile.profile_image) as profile_image:
+                    self.assertEqual(profile_image.size, settings.PROFILE_IMG["SIZE"])
+
+    def test_profile_image_is_not_reprocessed_on_save(self):
+        """Whether saving a profile without a new upload keeps the stored images"""
+
+        self.attach_image()
+        self.test_profile.save()
+        image_name = self.test_profile.profile_image.name
+        thumb_name = self.test_profile.profile_image_thumb.name
+
+        self.test_profile.about_me = "New About Me"
+        self.test_profile.save()
+
+        self.assertEqual(self.test_profile.profile_image.name, image_name)
+        self.assertEqual(self.test_profile.profile_image_thumb.name, thumb_name)
+
+    def test_profile_has_uploaded_image_url(self):
+        """Whether a profile with an uploaded image links to the stored files"""
+
+        self.assertEqual(
+            self.test_profile.profile_image_url, "/static/img/no_image_md.png"
+        )
+        self.attach_image()
+        self.test_profile.save()
+
+        self.assertEqual(
+            self.test_profile.profile_image_url, self.test_profile.profile_image.url
+        )
+        self.assertEqual(
+            self.test_profile.profile_image_thumb_url,
+            self.test_profile.profile_image_thumb.url,
+        )
+
+    def test_image_existence_is_cached(self):
+        """Whether the storage is asked only once if a profile image exists"""
+
+        self.attach_image()
+        self.test_profile.save()
+
+        with mock.patch(
+            "accounts.models.default_storage.exists", return_value=True
+        ) as exists:
+            for _ in range(2):
+                profile = Profile.objects.get(pk=self.test_profile.pk)
+                self.assertEqual(profile.profile_image_url, profile.profile_image.url)
+
+        exists.assert_called_once_with(self.test_profile.profile_image.name)
+
+    @override_settings(IMGPROXY_URL="https://imgproxy.test/")
+    def test_profile_thumb_url_uses_imgproxy(self):
+        """Whether the thumbnail is served by imgproxy when it is configured"""
+
+        self.attach_image()
+        self.test_profile.save()
+
+        self.assertEqual(
+            self.test_profile.profile_image_thumb_url,
+            "https://imgproxy.test/insecure/rs:fill:40:40/plain/"
+            + quote(self.test_profile.profile_image.url, safe=""),
+        )
+
+    @override_settings(
+        IMGPROXY_URL="https://imgproxy.test",
+        IMGPROXY_KEY="6b6579",
+        IMGPROXY_SALT="73616c74",
+    )
+    def test_signed_imgproxy_url(self):
+        """Whether imgproxy URLs are signed when a key and salt are configured"""
+
+        path = "/rs:fill:40:40/plain/https%3A%2F%2Fmedia.test%2Fimage.jpg"
+        # base64url(HMAC-SHA256(key=b"key", msg=b"salt" + path)) without padding
+        signature = "hQwV-dsfnnCzA3uvFMg4Q8HbAIk-ojVW1Pl9xa8JURo"
+
+        self.assertEqual(
+            imgproxy_url("https://media.test/image.jpg", (40, 40)),
+            f"https://imgproxy.test/{signature}{path}",
+        )
+
+    @override_settings(IMGPROXY_URL="https://imgproxy.test/")
+    def test_imgproxy_thumb_url_for_missing_image(self):
+        """Whether a missing profile image falls back to the placeholder"""
+
+        self.test_profile.profile_image = "profile_uploads/missing.jpg"
+
+        self.assertEqual(
+            self.test_profile.profile_image_thumb_url, "/static/img/no_image_md.png"
+        )
+
+    def test_resized_image_size_matches_encoded_file(self):
+        """Whether the resized uploads report the size of the encoded JPEG"""
+
+        self.attach_image()
+        self.test_profile.resize_profile_image()
+
+        for image in (
+            self.test_profile.profile_image,
+            self.test_profile.profile_image_thumb,
+        ):
+            self.assertEqual(image.size, len(image.read()))
+
 
 class UserModelTest(TestCase):
     """A class to test Profile model"""
@@ -53,3 +212,25 @@ class UserModelTest(TestCase):
             username="testuser", email="test@test.com", password="password123"
         )
         self.assertEqual(Profile.objects.count(), 1)
+
+    def test_upvoted_solutions(self):
+        """Whether only positive votes on solutions are returned"""
+
+        user = get_user_model().objects.create_user(
+            username="testuser", email="test@test.com", password="password123"
+        )
+        thread = Thread.objects.create(author=user, title="Thread", summary="Summary")
+        solution = Civi.objects.create(
+            thread=thread, author=user, title="Solution", c_type="solution"
+        )
+        problem = Civi.objects.create(
+            thread=thread, author=user, title="Problem", c_type="problem"
+        )
+        upvotes = [
+            Activity.objects.create(user=user, civi=solution, activity_type=vote)
+            for vote in ("vote_pos", "vote_vpos")
+        ]
+        Activity.objects.create(user=user, civi=solution, activity_type="vote_neg")
+        Activity.objects.create(user=user, civi=problem, activity_type="vote_pos")
+
+        self.assertQuerysetEqual(user.upvoted_solutions, upvotes, ordered=False)
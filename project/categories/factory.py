@@ -7,4 +7,4 @@ class CategoryFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Category
 
-    name = factory.Faker("lorem")
+    name = factory.Faker("word")
@@ -1,7 +1,13 @@
+import base64
+import hashlib
+import hmac
 import os
 import uuid
+from urllib.parse import quote
+
 import requests
 import PIL
+from django.conf import settings
 from django.utils.deconstruct import deconstructible
 from django.db import connections
 from django.core.files import File
@@ -23,6 +29,25 @@ class PathAndRename:
         return os.path.join(self.sub_path, filename)
 
 
+def imgproxy_url(source_url, size):
+    """Return an imgproxy URL that crops and resizes the source image to size"""
+
+    width, height = size
+    path = f"/rs:fill:{width}:{height}/plain/{quote(source_url, safe='')}"
+
+    if settings.IMGPROXY_KEY and settings.IMGPROXY_SALT:
+        digest = hmac.new(
+            bytes.fromhex(settings.IMGPROXY_KEY),
+            bytes.fromhex(settings.IMGPROXY_SALT) + path.encode(),
+            hashlib.sha256,
+        ).digest()
+        signature = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    else:
+        signature = "insecure"
+
+    return f"{settings.IMGPROXY_URL.rstrip('/')}/{signature}{path}"
+
+
 def check_database(database):
     """Get the name of database engine running currently"""
 
@@ -6,6 +6,8 @@ Production settings file to select proper environment variables.
 """
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 # False if not in os.environ
 DEBUG = os.getenv("DEBUG", False)
 
@@ -117,6 +119,15 @@ PROFILE_IMG = {
     "WHITE_BG": (255, 255, 255),
 }
 
+# Optional imgproxy service for resizing profile thumbnails on the fly.
+# KEY and SALT are hex-encoded and must match the imgproxy configuration.
+IMGPROXY_URL = os.getenv("IMGPROXY_URL")
+IMGPROXY_KEY = os.getenv("IMGPROXY_KEY")
+IMGPROXY_SALT = os.getenv("IMGPROXY_SALT")
+
+if bool(IMGPROXY_KEY) != bool(IMGPROXY_SALT):
+    raise ImproperlyConfigured("IMGPROXY_KEY and IMGPROXY_SALT must be set together.")
+
 # Use DATABASE_URL in production
 DATABASE_URL = os.getenv("DATABASE_URL")
 
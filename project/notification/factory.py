@@ -1,9 +1,9 @@
 import factory
 import factory.fuzzy
-from account.factory import ProfileFactory
+from accounts.factory import ProfileFactory
 from threads.factory import CiviFactory, ThreadFactory
 
-from .models import Notification
+from .models import ActivityType, Notification
 
 
 class NotificationFactory(factory.django.DjangoModelFactory):
@@ -13,5 +13,5 @@ class NotificationFactory(factory.django.DjangoModelFactory):
     account = factory.SubFactory(ProfileFactory)
     thread = factory.SubFactory(ThreadFactory)
     civi = factory.SubFactory(CiviFactory)
-    activity_type = factory.Faker("lorem")
+    activity_type = factory.fuzzy.FuzzyChoice(choices=ActivityType.values)
     read = factory.fuzzy.FuzzyChoice(choices=[True, False])
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.13 on 2026-10-14 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["account", "read", "-created"], name="notif_inbox_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["account", "-created"], name="notif_feed_idx"),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.1.13 on 2026-10-14 11:30
+
+from django.db import migrations, models
+
+# Stored activity type strings and their integer values.
+# "response_to_yout_civi" was the value in the initial migration.
+ACTIVITY_TYPES = {
+    "new_follower": 1,
+    "response_to_your_civi": 2,
+    "response_to_yout_civi": 2,
+    "rebuttal_to_your_response": 3,
+}
+
+
+def activity_type_to_int(apps, schema_editor):
+    Notification = apps.get_model("notification", "Notification")
+    for name, value in ACTIVITY_TYPES.items():
+        Notification.objects.filter(activity_type=name).update(activity_type_int=value)
+
+
+def activity_type_to_str(apps, schema_editor):
+    Notification = apps.get_model("notification", "Notification")
+    for name, value in ACTIVITY_TYPES.items():
+        if name != "response_to_yout_civi":
+            Notification.objects.filter(activity_type_int=value).update(
+                activity_type=name
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0002_notification_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="activity_type_int",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "New follower"),
+                    (2, "Response to your civi"),
+                    (3, "Rebuttal to your response"),
+                ],
+                default=1,
+            ),
+        ),
+        migrations.RunPython(activity_type_to_int, activity_type_to_str),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.1.13 on 2026-10-14 11:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0003_notification_activity_type_int"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="notification",
+            name="activity_type",
+        ),
+        migrations.RenameField(
+            model_name="notification",
+            old_name="activity_type_int",
+            new_name="activity_type",
+        ),
+    ]
@@ -5,12 +5,33 @@ Notifies users about new followers or replies.
 from django.db import models
 from accounts.models import Profile
 from threads.models import Civi, Thread
-from enum import Enum
 
-class ActivityType(Enum):
-    NEW_FOLLOWER = "new_follower"
-    RESPONSE_TO_CIVI = "response_to_your_civi"
-    REBUTTAL_TO_RESPONSE = "rebuttal_to_your_response"
+
+class ActivityType(models.IntegerChoices):
+    NEW_FOLLOWER = 1, "New follower"
+    RESPONSE_TO_CIVI = 2, "Response to your civi"
+    REBUTTAL_TO_RESPONSE = 3, "Rebuttal to your response"
+
+
+class NotificationQuerySet(models.QuerySet):
+    def for_inbox(self, user):
+        """
+        Notifications of the given user, newest first, with the related
+        profile, thread and civi columns used for listing them
+        """
+        return (
+            self.filter(account__user=user)
+            .select_related("account__user", "thread", "civi")
+            .only(
+                "read",
+                "created",
+                "activity_type",
+                "account__user__username",
+                "thread__title",
+                "civi__title",
+            )
+            .order_by("-created")
+        )
 
 
 class Notification(models.Model):
@@ -27,14 +48,25 @@ class Notification(models.Model):
         help_text="The Civi solution associated with the notification, if any."
     )
 
-    activity_CHOICES = [(tag.value, tag.name.replace("_", " ").capitalize()) for tag in ActivityType]
-    activity_type = models.CharField(
-        max_length=31, default=ActivityType.NEW_FOLLOWER.value, choices=activity_CHOICES
+    activity_type = models.PositiveSmallIntegerField(
+        default=ActivityType.NEW_FOLLOWER, choices=ActivityType.choices
     )
     read = models.BooleanField(default=False)
 
     created = models.DateTimeField(auto_now_add=True)
     last_modified = models.DateTimeField(auto_now=True)
 
+    objects = NotificationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Unread notifications of a profile, newest first
+            models.Index(
+                fields=["account", "read", "-created"], name="notif_inbox_idx"
+            ),
+            # All notifications of a profile, newest first
+            models.Index(fields=["account", "-created"], name="notif_feed_idx"),
+        ]
+
     def __str__(self):
-        return f"Notification({self.account}, {self.activity_type})"
+        return f"Notification({self.account_id}, {self.activity_type})"
@@ -0,0 +1,69 @@
+import datetime
+
+from accounts.factory import ProfileFactory
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils import timezone
+from notification.factory import NotificationFactory
+from notification.models import ActivityType, Notification
+
+
+class NotificationModelTests(TestCase):
+    """A class to test Notification model"""
+
+    def test_factory_uses_activity_types(self):
+        """Whether the factory only creates notifications of known activity types"""
+
+        for notification in NotificationFactory.create_batch(10):
+            notification.refresh_from_db()
+            self.assertIn(notification.activity_type, ActivityType.values)
+
+    def test_activity_type_accepts_only_activity_types(self):
+        """Whether the activity type field rejects values outside ActivityType"""
+
+        other_fields = ["account", "thread", "civi"]
+        Notification(activity_type=ActivityType.RESPONSE_TO_CIVI).full_clean(
+            exclude=other_fields
+        )
+
+        for value in (0, 4, "new_follower"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    Notification(activity_type=value).full_clean(exclude=other_fields)
+
+
+class NotificationInboxTests(TestCase):
+    """A class to test the notification inbox queryset"""
+
+    def setUp(self) -> None:
+        self.profile = ProfileFactory()
+        now = timezone.now()
+        self.notifications = []
+        for hours_ago in (2, 0, 1):
+            notification = NotificationFactory(account=self.profile)
+            Notification.objects.filter(pk=notification.pk).update(
+                created=now - datetime.timedelta(hours=hours_ago)
+            )
+            self.notifications.append(notification)
+        NotificationFactory()
+
+    def test_inbox_has_only_notifications_of_the_user(self):
+        """Whether the inbox lists the user's notifications, newest first"""
+
+        inbox = Notification.objects.for_inbox(self.profile.user)
+
+        self.assertQuerysetEqual(
+            inbox,
+            [self.notifications[1], self.notifications[2], self.notifications[0]],
+        )
+
+    def test_inbox_loads_related_objects_in_one_query(self):
+        """Whether listing the inbox needs no extra query per notification"""
+
+        user = self.profile.user
+
+        with self.assertNumQueries(1):
+            for notification in Notification.objects.for_inbox(user):
+                notification.account.user.username
+                notification.thread.title
+                notification.civi.title
@@ -1,7 +1,8 @@
 import factory
 import factory.fuzzy
+from accounts.factory import UserFactory
 from categories.factory import CategoryFactory
-from django.contrib.auth.models import User
+from core.constants import CIVI_TYPES
 
 from .models import (
     Activity,
@@ -19,17 +20,17 @@ class FactFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Fact
 
-    body = factory.Faker("lorem")
+    body = factory.Faker("sentence")
 
 
 class ThreadFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Thread
 
-    author = User.objects.get_or_create(username="admin")
+    author = factory.SubFactory(UserFactory)
     category = factory.SubFactory(CategoryFactory)
-    title = factory.Faker("lorem")
-    summary = factory.Faker("lorem")
+    title = factory.Faker("sentence")
+    summary = factory.Faker("sentence")
     image = factory.Faker("image_url")
     is_draft = factory.fuzzy.FuzzyChoice(choices=[True, False])
     num_views = 0
@@ -65,11 +66,11 @@ class CiviFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Civi
 
-    author = User.objects.get_or_create(username="admin")
+    author = factory.SubFactory(UserFactory)
     thread = factory.SubFactory(ThreadFactory)
-    title = factory.Faker("lorem")
-    body = factory.Faker("lorem")
-    c_type = factory.Faker("lorem")
+    title = factory.Faker("sentence")
+    body = factory.Faker("sentence")
+    c_type = factory.fuzzy.FuzzyChoice(choices=[key for key, _ in CIVI_TYPES])
     votes_vneg = 0
     votes_neg = 0
     votes_neutral = 0
@@ -97,10 +98,10 @@ class ResponseFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Response
 
-    author = User.objects.get_or_create(username="admin")
+    author = factory.SubFactory(UserFactory)
     civi = factory.SubFactory(CiviFactory)
-    title = factory.Faker("lorem")
-    body = factory.Faker("lorem")
+    title = factory.Faker("sentence")
+    body = factory.Faker("sentence")
     votes_vneg = 0
     votes_neg = 0
     votes_neutral = 0
@@ -113,7 +114,7 @@ class CiviImageFactory(factory.django.DjangoModelFactory):
         model = CiviImage
 
     civi = factory.SubFactory(CiviFactory)
-    title = factory.Faker("lorem")
+    title = factory.Faker("sentence")
     image = factory.Faker("image_url")
 
     @factory.post_generation
@@ -129,10 +130,12 @@ class ActivityFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Activity
 
-    user = factory.SubFactory("app.factories.UserFactory")
+    user = factory.SubFactory(UserFactory)
     thread = factory.SubFactory(ThreadFactory)
     civi = factory.SubFactory(CiviFactory)
-    activity_type = factory.Faker("lorem")
+    activity_type = factory.fuzzy.FuzzyChoice(
+        choices=[key for key, _ in Activity.activity_CHOICES]
+    )
     read = factory.fuzzy.FuzzyChoice(choices=[True, False])
 
 
@@ -140,9 +143,9 @@ class RebuttalFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Rebuttal
 
-    author = User.objects.get_or_create(username="admin")
+    author = factory.SubFactory(UserFactory)
     response = factory.SubFactory(ResponseFactory)
-    body = factory.Faker("lorem")
+    body = factory.Faker("sentence")
     votes_vneg = 0
     votes_neg = 0
     votes_neutral = 0
@@ -154,8 +157,8 @@ class RationaleFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Rationale
 
-    title = factory.Faker("lorem")
-    body = factory.Faker("lorem")
+    title = factory.Faker("sentence")
+    body = factory.Faker("sentence")
     votes_vneg = 0
     votes_neg = 0
     votes_neutral = 0
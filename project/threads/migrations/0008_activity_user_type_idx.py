@@ -0,0 +1,21 @@
+# Generated by Django 4.1.13 on 2026-10-14 10:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("threads", "0007_alter_activity_civi_alter_activity_thread_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                fields=["user", "activity_type"], name="activity_user_type_idx"
+            ),
+        ),
+    ]
@@ -514,6 +514,11 @@ class Activity(models.Model):
 
     class Meta:
         verbose_name_plural = "Activities"
+        indexes = [
+            models.Index(
+                fields=["user", "activity_type"], name="activity_user_type_idx"
+            ),
+        ]
 
 
 class Rebuttal(models.Model):